@@ -1,6 +1,38 @@
 import maya.cmds as cmds
 import math
 import re
+from array import array
+
+class StrandSet():
+    """
+    Columnar store for a batch of joint chains.
+    Points of every strand share one flat position array; strand i owns points offsets[i]:offsets[i+1].
+    """
+    def __init__(self):
+        self.positions = array('d')     # x, y, z per point
+        self.names = []                 # joint name per point, None until the joint exists
+        self.offsets = array('l', [0])
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def add_strand(self, positions, names=None):
+        # positions is a flat x, y, z sequence
+        count = len(positions) // 3
+        self.positions.extend(positions)
+        self.names.extend(names or [None] * count)
+        self.offsets.append(self.offsets[-1] + count)
+
+    def strand_range(self, strand):
+        return range(self.offsets[strand], self.offsets[strand + 1])
+
+    def position(self, point):
+        return tuple(self.positions[point * 3:point * 3 + 3])
+
+    def chain_length(self, strand):
+        # straight-line distance from root to tip
+        first, last = self.offsets[strand], self.offsets[strand + 1] - 1
+        return math.sqrt(sum([(a - b) ** 2 for a, b in zip(self.position(first), self.position(last))]))
 
 class CurveToRigTool():
     def __init__(self):
@@ -480,32 +512,66 @@ class CurveToRigTool():
             cmds.warning("Selection is not a valid NURBS curve.")
             return
 
-        # duplicate curve to rebuild it (clean topo for even joint spacing)
-        temp_curve = cmds.duplicate(curve_node, name="TEMP_CURVE_PROCESSING")[0]
-        cmds.rebuildCurve(temp_curve, ch=False, rpo=1, rt=0, end=1, kr=0, kcp=0, kep=1, kt=0, s=count*4, d=3, tol=0.01)
-
-        cmds.select(clear=True)
-        created_joints = []
+        strands = self.build_chains(self.sample_curves([curve_node], count), orient_str)
         
-        for i in range(count):
-            u_param = 0.5 if count == 1 else float(i) / float(count - 1)
-            
-            pos = cmds.pointOnCurve(temp_curve, pr=u_param, top=True, position=True)
-            jnt = cmds.joint(p=pos, name=f"curveJnt_{i+1:02d}")
-            created_joints.append(jnt)
-            
-        # orient joints
-        if len(created_joints) > 1:
-            cmds.joint(created_joints[0], edit=True, orientJoint=orient_str, secondaryAxisOrient='yup', children=True, zeroScaleOrient=True)
-            # zero out the tip joint orientation
-            cmds.joint(created_joints[-1], edit=True, orientJoint='none', zeroScaleOrient=True)
-            cmds.setAttr(f"{created_joints[-1]}.jointOrient", 0, 0, 0)
+        cmds.select(strands.names[0])
+        print(f"Chain created: {len(strands.names)} joints.")
 
-        cmds.delete(temp_curve)
-        
-        if created_joints:
-            cmds.select(created_joints[0])
-            print(f"Chain created: {len(created_joints)} joints.")
+    def sample_curves(self, curves, count):
+        """
+        Samples evenly spaced joint positions along each curve.
+        Returns a StrandSet with one strand per curve.
+        """
+        strands = StrandSet()
+        for curve_node in curves:
+            # duplicate curve to rebuild it (clean topo for even joint spacing)
+            temp_curve = cmds.duplicate(curve_node, name="TEMP_CURVE_PROCESSING")[0]
+            cmds.rebuildCurve(temp_curve, ch=False, rpo=1, rt=0, end=1, kr=0, kcp=0, kep=1, kt=0, s=count*4, d=3, tol=0.01)
+
+            positions = array('d')
+            for i in range(count):
+                u_param = 0.5 if count == 1 else float(i) / float(count - 1)
+                positions.extend(cmds.pointOnCurve(temp_curve, pr=u_param, top=True, position=True))
+
+            cmds.delete(temp_curve)
+            strands.add_strand(positions)
+        return strands
+
+    def build_chains(self, strands, orient_str, prefix="curveJnt"):
+        """
+        Creates and orients one joint chain per strand.
+        Fills in strands.names with the created joints.
+        """
+        for strand in range(len(strands)):
+            # batches get a strand number so chains don't fight over names
+            chain_prefix = prefix if len(strands) == 1 else f"{prefix}_{strand+1:03d}"
+            points = strands.strand_range(strand)
+
+            cmds.select(clear=True)
+            for i, point in enumerate(points):
+                strands.names[point] = cmds.joint(p=strands.position(point), name=f"{chain_prefix}_{i+1:02d}")
+
+            # orient joints
+            if len(points) > 1:
+                root_jnt, tip_jnt = strands.names[points[0]], strands.names[points[-1]]
+                cmds.joint(root_jnt, edit=True, orientJoint=orient_str, secondaryAxisOrient='yup', children=True, zeroScaleOrient=True)
+                # zero out the tip joint orientation
+                cmds.joint(tip_jnt, edit=True, orientJoint='none', zeroScaleOrient=True)
+                cmds.setAttr(f"{tip_jnt}.jointOrient", 0, 0, 0)
+        return strands
+
+    def read_chains(self, start_joints):
+        """
+        Collects existing joint chains into a StrandSet, root to tip.
+        Start joints without child joints are skipped.
+        """
+        strands = StrandSet()
+        for start_joint in start_joints:
+            descendants = cmds.listRelatives(start_joint, allDescendents=True, type='joint') or []
+            if not descendants: continue
+            chain = [start_joint] + list(reversed(descendants))
+            strands.add_strand(cmds.xform(chain, query=True, translation=True, worldSpace=True), chain)
+        return strands
 
     # SPLINE RIG
     def rig_spline_chain(self, *args):
@@ -515,77 +581,89 @@ class CurveToRigTool():
             cmds.warning("Select the start joint.")
             return
             
-        start_joint = sel[0]
         target_ctrl_count = cmds.intSliderGrp(self.spline_count_slider, query=True, value=True)
         size_multiplier = cmds.floatSliderGrp(self.ctrl_size_slider, query=True, value=True)
 
-        descendants = cmds.listRelatives(start_joint, allDescendents=True, type='joint') or []
-        if not descendants: return
-        end_joint = descendants[0]
+        strands = self.read_chains(sel[:1])
+        if not len(strands): return
 
-        chain_len = self.get_distance(start_joint, end_joint)
-        ctrl_radius = (chain_len / 12.0) * size_multiplier
-
-        # create IK handle and curve
-        ik_name = f"{start_joint}_SplineIK"
-        ik_results = cmds.ikHandle(startJoint=start_joint, endEffector=end_joint, solver='ikSplineSolver', 
-                                   createCurve=True, parentCurve=False, simplifyCurve=False, name=ik_name)
-        ik_handle = ik_results[0]
-        ik_curve = cmds.rename(ik_results[2], f"{start_joint}_SplineCrv")
-        
-        # stop double transforms on the curve
-        cmds.setAttr(f"{ik_curve}.inheritsTransform", 0)
-        cmds.setAttr(f"{ik_curve}.visibility", 0)
-        cmds.setAttr(f"{ik_handle}.visibility", 0)
+        master_grps = self.build_spline_rigs(strands, target_ctrl_count, size_multiplier)
+        
+        cmds.select(master_grps)
+        print("Spline Rig Complete.")
 
-        # smooth curve
-        cmds.rebuildCurve(ik_curve, ch=False, rpo=1, rt=0, end=1, kr=0, kcp=0, kep=1, kt=0, s=60, d=3, tol=0.01)
+    def build_spline_rigs(self, strands, target_ctrl_count, size_multiplier=1.0):
+        """
+        Builds a spline IK rig on every chain in the StrandSet.
+        Expects strands.names to hold the joints (see build_chains / read_chains).
+        Returns the top-level rig group of each strand.
+        """
+        master_grps = []
+        for strand in range(len(strands)):
+            points = strands.strand_range(strand)
+            start_joint, end_joint = strands.names[points[0]], strands.names[points[-1]]
+
+            chain_len = strands.chain_length(strand)
+            ctrl_radius = (chain_len / 12.0) * size_multiplier
+
+            # create IK handle and curve
+            ik_name = f"{start_joint}_SplineIK"
+            ik_results = cmds.ikHandle(startJoint=start_joint, endEffector=end_joint, solver='ikSplineSolver', 
+                                       createCurve=True, parentCurve=False, simplifyCurve=False, name=ik_name)
+            ik_handle = ik_results[0]
+            ik_curve = cmds.rename(ik_results[2], f"{start_joint}_SplineCrv")
+            
+            # stop double transforms on the curve
+            cmds.setAttr(f"{ik_curve}.inheritsTransform", 0)
+            cmds.setAttr(f"{ik_curve}.visibility", 0)
+            cmds.setAttr(f"{ik_handle}.visibility", 0)
 
-        # groups for organization
-        ctrl_grp = cmds.group(empty=True, name=f"{start_joint}_Controls_Grp")
-        driver_joints_grp = cmds.group(empty=True, name=f"{start_joint}_DriverJnts_Grp")
-        cmds.setAttr(f"{driver_joints_grp}.visibility", 0)
+            # smooth curve
+            cmds.rebuildCurve(ik_curve, ch=False, rpo=1, rt=0, end=1, kr=0, kcp=0, kep=1, kt=0, s=60, d=3, tol=0.01)
 
-        driver_joints = []
-        
-        for i in range(target_ctrl_count):
-            u_param = float(i) / float(target_ctrl_count - 1)
-            pos = cmds.pointOnCurve(ik_curve, pr=u_param, top=True, position=True)
-            
-            ctrl_name = f"{start_joint}_SplineCtrl_{i+1:02d}"
-            
-            # create control
-            ctrl = self.create_wireframe_sphere(name=ctrl_name, radius=ctrl_radius)
-            self.set_color(ctrl, 17) 
-            cmds.xform(ctrl, translation=pos, worldSpace=True)
-            
-            offset_grp = self.create_offset_group(ctrl)
-            
-            # create driver joint (hidden bones that skin the curve)
-            cmds.select(clear=True)
-            drv_jnt = cmds.joint(p=pos, name=f"{start_joint}_DriverJnt_{i+1:02d}")
-            cmds.setAttr(f"{drv_jnt}.radius", 0.1) 
-            cmds.setAttr(f"{drv_jnt}.drawStyle", 2) # hide
+            # groups for organization
+            ctrl_grp = cmds.group(empty=True, name=f"{start_joint}_Controls_Grp")
+            driver_joints_grp = cmds.group(empty=True, name=f"{start_joint}_DriverJnts_Grp")
+            cmds.setAttr(f"{driver_joints_grp}.visibility", 0)
 
-            cmds.parent(drv_jnt, ctrl)
-            cmds.parent(offset_grp, ctrl_grp)
+            driver_joints = []
             
-            driver_joints.append(drv_jnt)
+            for i in range(target_ctrl_count):
+                u_param = float(i) / float(target_ctrl_count - 1)
+                pos = cmds.pointOnCurve(ik_curve, pr=u_param, top=True, position=True)
+                
+                ctrl_name = f"{start_joint}_SplineCtrl_{i+1:02d}"
+                
+                # create control
+                ctrl = self.create_wireframe_sphere(name=ctrl_name, radius=ctrl_radius)
+                self.set_color(ctrl, 17) 
+                cmds.xform(ctrl, translation=pos, worldSpace=True)
+                
+                offset_grp = self.create_offset_group(ctrl)
+                
+                # create driver joint (hidden bones that skin the curve)
+                cmds.select(clear=True)
+                drv_jnt = cmds.joint(p=pos, name=f"{start_joint}_DriverJnt_{i+1:02d}")
+                cmds.setAttr(f"{drv_jnt}.radius", 0.1) 
+                cmds.setAttr(f"{drv_jnt}.drawStyle", 2) # hide
+
+                cmds.parent(drv_jnt, ctrl)
+                cmds.parent(offset_grp, ctrl_grp)
+                
+                driver_joints.append(drv_jnt)
 
-        # bind curve to driver joints
-        cmds.select(driver_joints)
-        cmds.select(ik_curve, add=True)
-        cmds.skinCluster(toSelectedBones=True, bindMethod=0, maximumInfluences=2, normalizeWeights=1, name=f"{start_joint}_SplineSkinCluster")
+            # bind curve to driver joints
+            cmds.select(driver_joints)
+            cmds.select(ik_curve, add=True)
+            cmds.skinCluster(toSelectedBones=True, bindMethod=0, maximumInfluences=2, normalizeWeights=1, name=f"{start_joint}_SplineSkinCluster")
 
-        # cleanup
-        root_joint = self.get_root_joint(start_joint)
-        mechanics_grp = cmds.group(ik_handle, ik_curve, driver_joints_grp, name=f"{start_joint}_Mechanics_Grp")
-        cmds.setAttr(f"{mechanics_grp}.visibility", 0)
-        
-        master_grp = cmds.group(root_joint, ctrl_grp, mechanics_grp, name=f"{start_joint}_SplineRig_Grp")
-        
-        cmds.select(master_grp)
-        print("Spline Rig Complete.")
+            # cleanup
+            root_joint = self.get_root_joint(start_joint)
+            mechanics_grp = cmds.group(ik_handle, ik_curve, driver_joints_grp, name=f"{start_joint}_Mechanics_Grp")
+            cmds.setAttr(f"{mechanics_grp}.visibility", 0)
+            
+            master_grps.append(cmds.group(root_joint, ctrl_grp, mechanics_grp, name=f"{start_joint}_SplineRig_Grp"))
+        return master_grps
 
     # IK RP RIG
     def rig_selected_joint(self, *args):